@@ -1,7 +1,7 @@
 /**
- * Convert QMK-style HSV (0-255 each) to CSS rgb() string.
+ * Convert QMK-style HSV (0-255 each) to RGB components (0-255 each).
  */
-export function hsvToRgb(h: number, s: number, v: number): string {
+function hsvToRgbParts(h: number, s: number, v: number): [number, number, number] {
   const hNorm = (h / 255) * 360;
   const sNorm = s / 255;
   const vNorm = v / 255;
@@ -31,6 +31,14 @@ export function hsvToRgb(h: number, s: number, v: number): string {
   const G = Math.round((g + m) * 255);
   const B = Math.round((b + m) * 255);
 
+  return [R, G, B];
+}
+
+/**
+ * Convert QMK-style HSV (0-255 each) to CSS rgb() string.
+ */
+export function hsvToRgb(h: number, s: number, v: number): string {
+  const [R, G, B] = hsvToRgbParts(h, s, v);
   return `rgb(${R}, ${G}, ${B})`;
 }
 
@@ -38,17 +46,19 @@ export function hsvToRgb(h: number, s: number, v: number): string {
  * Convert QMK-style HSV (0-255 each) to hex string (e.g. "#FF00AA").
  */
 export function hsvToHex(h: number, s: number, v: number): string {
-  const rgb = hsvToRgb(h, s, v);
-  const match = rgb.match(/\d+/g)!;
-  return `#${match.map((c) => Number(c).toString(16).padStart(2, "0")).join("").toUpperCase()}`;
+  const [R, G, B] = hsvToRgbParts(h, s, v);
+  return `#${[R, G, B].map((c) => c.toString(16).padStart(2, "0")).join("").toUpperCase()}`;
 }
 
+// Hex color validation pattern, compiled once at module load.
+const HEX_RE = /^([0-9a-f]{6})$/i;
+
 /**
  * Convert hex color string (e.g. "#FF00AA") to QMK-style HSV (0-255 each).
  * Returns null if the hex string is invalid.
  */
 export function hexToHsv(hex: string): { h: number; s: number; v: number } | null {
-  const m = hex.replace("#", "").match(/^([0-9a-f]{6})$/i);
+  const m = hex.replace("#", "").match(HEX_RE);
   if (!m) return null;
   const r = parseInt(m[1].slice(0, 2), 16) / 255;
   const g = parseInt(m[1].slice(2, 4), 16) / 255;
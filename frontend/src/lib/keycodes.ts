@@ -211,6 +211,15 @@ for (const kc of KEYCODES) {
   codeToDefMap.set(kc.code, kc);
 }
 
+// ── Category buckets, built once at module load ─────────────────────────
+
+const keycodesByCategory = new Map<KeycodeCategory, KeycodeDef[]>();
+for (const kc of KEYCODES) {
+  const bucket = keycodesByCategory.get(kc.category);
+  if (bucket) bucket.push(kc);
+  else keycodesByCategory.set(kc.category, [kc]);
+}
+
 // ── Modifier names for display ──────────────────────────────────────────
 
 const MOD_NAMES: [number, string][] = [
@@ -222,6 +231,10 @@ const MOD_NAMES: [number, string][] = [
 
 // ── Public API ──────────────────────────────────────────────────────────
 
+// Composite/fallback labels are built with string work; cache them so
+// re-renders of the key grid hit the map instead.
+const labelCache = new Map<number, string>();
+
 /**
  * Convert a keycode (including QK_MODS composites) to a human-readable label.
  */
@@ -230,6 +243,10 @@ export function keycodeToLabel(code: number): string {
   const direct = codeToDefMap.get(code);
   if (direct) return direct.label;
 
+  const cached = labelCache.get(code);
+  if (cached !== undefined) return cached;
+
+  let label: string;
   // QK_MODS range: 0x0100-0x1FFF — modifier + base keycode
   if (code >= 0x0100 && code <= 0x1fff) {
     const mods = code & 0x1f00;
@@ -240,17 +257,20 @@ export function keycodeToLabel(code: number): string {
     }
     const baseDef = codeToDefMap.get(base);
     parts.push(baseDef ? baseDef.label : `0x${base.toString(16)}`);
-    return parts.join("+");
+    label = parts.join("+");
+  } else {
+    label = `0x${code.toString(16).toUpperCase().padStart(4, "0")}`;
   }
 
-  return `0x${code.toString(16).toUpperCase().padStart(4, "0")}`;
+  labelCache.set(code, label);
+  return label;
 }
 
 /**
  * Get all keycodes in a given category.
  */
 export function getKeycodesByCategory(category: KeycodeCategory): KeycodeDef[] {
-  return KEYCODES.filter((kc) => kc.category === category);
+  return keycodesByCategory.get(category) ?? [];
 }
 
 /**
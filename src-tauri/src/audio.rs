@@ -14,7 +14,7 @@ use std::fs;
 use std::io::BufReader;
 use std::path::{Path, PathBuf};
 use std::sync::atomic::{AtomicU32, Ordering};
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, OnceLock};
 use std::time::Duration;
 
 use crate::state::SoundEntry;
@@ -79,13 +79,20 @@ fn find_output_device(name: &str) -> Option<cpal::Device> {
 
 // ── Sound file management ───────────────────────────────────────────
 
+// Resolved once; every sound operation goes through here, so skip the
+// repeated config-dir lookup and exists() check after the first call.
+static SOUNDS_DIR: OnceLock<PathBuf> = OnceLock::new();
+
 pub fn sounds_dir() -> Result<PathBuf> {
+    if let Some(dir) = SOUNDS_DIR.get() {
+        return Ok(dir.clone());
+    }
     let base = dirs::config_dir().context("Cannot determine config directory")?;
     let dir = base.join("deck8-hub").join("sounds");
     if !dir.exists() {
         fs::create_dir_all(&dir).context("Failed to create sounds directory")?;
     }
-    Ok(dir)
+    Ok(SOUNDS_DIR.get_or_init(|| dir).clone())
 }
 
 pub fn delete_sound(filename: &str) -> Result<()> {
@@ -255,6 +262,38 @@ pub fn preview_trim(source_path: &str, start_ms: u64, end_ms: u64) -> Result<()>
     Ok(())
 }
 
+/// Play a whole sound file through the default output device.
+/// Decodes the file once, streaming straight into the sink — used as the
+/// fallback when the soundboard pipeline is not running.
+pub fn play_file(path: &Path) -> Result<()> {
+    let path = path.to_path_buf();
+    // Same threading constraint as preview_trim: OutputStream is !Send on
+    // Windows, so the spawned thread owns both the stream and sink.
+    std::thread::spawn(move || {
+        let Ok((_stream, handle)) = OutputStream::try_default() else {
+            error!("[audio] Failed to open default output for playback");
+            return;
+        };
+        let Ok(sink) = Sink::try_new(&handle) else {
+            error!("[audio] Failed to create playback sink");
+            return;
+        };
+        let Ok(file) = fs::File::open(&path) else {
+            error!("[audio] Cannot open: {}", path.display());
+            return;
+        };
+        let reader = BufReader::new(file);
+        let Ok(source) = Decoder::new(reader) else {
+            error!("[audio] Failed to decode: {}", path.display());
+            return;
+        };
+        sink.append(source);
+        sink.sleep_until_end();
+    });
+
+    Ok(())
+}
+
 // ── MicSource (rodio::Source reading from ring buffer) ───────────────
 
 struct MicSource {
@@ -369,9 +408,9 @@ impl AudioPipeline {
             .build_input_stream(
                 &input_config.into(),
                 move |data: &[f32], _: &cpal::InputCallbackInfo| {
-                    for &sample in data {
-                        let _ = producer.try_push(sample);
-                    }
+                    // Bulk copy; drops excess samples if the buffer is full,
+                    // same as the old per-sample try_push.
+                    let _ = producer.push_slice(data);
                 },
                 move |err| {
                     error!("[audio] Input stream error: {}", err);
@@ -432,40 +471,54 @@ impl AudioPipeline {
             // Collect all samples as f32 (normalized to [-1, 1])
             let raw: Vec<f32> = source.convert_samples::<f32>().collect();
 
-            // Channel conversion
-            let chan_converted: Vec<f32> = if src_channels == 2 && dst_channels == 1 {
-                raw.chunks(2)
-                    .map(|c| (c[0] + c.get(1).copied().unwrap_or(0.0)) / 2.0)
-                    .collect()
-            } else if src_channels == 1 && dst_channels == 2 {
-                raw.iter().flat_map(|&s| [s, s]).collect()
+            // Channel + sample rate conversion, fused into one pass so the
+            // intermediate channel-converted buffer is never materialized.
+            // `sample_at` reads channel-converted samples straight from `raw`.
+            let stereo_to_mono = src_channels == 2 && dst_channels == 1;
+            let mono_to_stereo = src_channels == 1 && dst_channels == 2;
+            let converted_len = if stereo_to_mono {
+                (raw.len() + 1) / 2
+            } else if mono_to_stereo {
+                raw.len() * 2
             } else {
-                raw
+                raw.len()
+            };
+            let sample_at = |i: usize| -> f32 {
+                if stereo_to_mono {
+                    let c = i * 2;
+                    (raw.get(c).copied().unwrap_or(0.0)
+                        + raw.get(c + 1).copied().unwrap_or(0.0))
+                        / 2.0
+                } else if mono_to_stereo {
+                    raw.get(i / 2).copied().unwrap_or(0.0)
+                } else {
+                    raw.get(i).copied().unwrap_or(0.0)
+                }
             };
 
-            // Sample rate conversion (linear interpolation)
             let resampled = if src_rate != dst_rate {
+                // Linear interpolation
                 let ratio = src_rate as f64 / dst_rate as f64;
-                let out_len = (chan_converted.len() as f64 / ratio) as usize;
+                let out_len = (converted_len as f64 / ratio) as usize;
                 let mut out = Vec::with_capacity(out_len);
                 for i in 0..out_len {
                     let src_pos = i as f64 * ratio;
                     let idx = src_pos as usize;
                     let frac = (src_pos - idx as f64) as f32;
-                    let s0 = chan_converted.get(idx).copied().unwrap_or(0.0);
-                    let s1 = chan_converted.get(idx + 1).copied().unwrap_or(s0);
+                    let s0 = if idx < converted_len { sample_at(idx) } else { 0.0 };
+                    let s1 = if idx + 1 < converted_len { sample_at(idx + 1) } else { s0 };
                     out.push(s0 + (s1 - s0) * frac);
                 }
                 out
+            } else if stereo_to_mono || mono_to_stereo {
+                (0..converted_len).map(sample_at).collect()
             } else {
-                chan_converted
+                raw
             };
 
             // Push to sound ring buffer (MicSource will mix it with mic)
             if let Ok(mut prod) = self.sound_producer.lock() {
-                for &sample in &resampled {
-                    let _ = prod.try_push(sample);
-                }
+                let _ = prod.push_slice(&resampled);
                 info!(
                     "[audio] Injected {} samples into mic stream ({}ch @ {}Hz)",
                     resampled.len(), dst_channels, dst_rate
@@ -942,12 +942,7 @@ fn preview_library_sound(
         pipeline.play_sound(&path).map_err(|e| e.to_string())
     } else {
         // Fallback: play through default output when soundboard is not running
-        audio::preview_trim(
-            path.to_str().unwrap_or(""),
-            0,
-            audio::get_audio_duration(path.to_str().unwrap_or(""))
-                .unwrap_or(60000),
-        ).map_err(|e| e.to_string())
+        audio::play_file(&path).map_err(|e| e.to_string())
     }
 }
 
@@ -1045,9 +1040,7 @@ fn do_toggle_key(app: &AppHandle, key_index: usize) {
             } else {
                 // Fallback: play through default output when soundboard is not running
                 drop(pl);
-                let path_str = path.to_str().unwrap_or("");
-                let dur = audio::get_audio_duration(path_str).unwrap_or(60000);
-                if let Err(e) = audio::preview_trim(path_str, 0, dur) {
+                if let Err(e) = audio::play_file(&path) {
                     warn!("[audio] Fallback play failed for key {}: {}", key_index, e);
                 }
             }
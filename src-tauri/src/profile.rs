@@ -2,6 +2,7 @@ use anyhow::{Context, Result};
 use serde::{Deserialize, Serialize};
 use std::fs;
 use std::path::PathBuf;
+use std::sync::{Mutex, OnceLock};
 
 use crate::state::{AudioConfig, KeyConfig};
 
@@ -17,16 +18,27 @@ struct PersistedState {
     pub keymaps: Option<Vec<u16>>,
 }
 
+// Cached after the first successful resolution; save_state runs on every
+// config change, so the config-dir lookup and create_dir_all only pay once.
+static STATE_FILE: OnceLock<PathBuf> = OnceLock::new();
+
 /// Path: %APPDATA%/deck8-hub/state.json
 fn state_file() -> Result<PathBuf> {
+    if let Some(path) = STATE_FILE.get() {
+        return Ok(path.clone());
+    }
     let base = dirs::config_dir().context("Cannot determine config directory")?;
     let dir = base.join("deck8-hub");
     if !dir.exists() {
         fs::create_dir_all(&dir).context("Failed to create config directory")?;
     }
-    Ok(dir.join("state.json"))
+    Ok(STATE_FILE.get_or_init(|| dir.join("state.json")).clone())
 }
 
+// Last JSON written to disk; lets save_state skip the write when nothing
+// actually changed (it fires on every slider tick).
+static LAST_SAVED: Mutex<Option<String>> = Mutex::new(None);
+
 /// Save current key state, audio config, and keymaps to disk.
 pub fn save_state(keys: &[KeyConfig; 8], audio_config: &AudioConfig, keymaps: &[u16; 8]) -> Result<()> {
     let persisted = PersistedState {
@@ -35,7 +47,13 @@ pub fn save_state(keys: &[KeyConfig; 8], audio_config: &AudioConfig, keymaps: &[
         keymaps: Some(keymaps.to_vec()),
     };
     let json = serde_json::to_string(&persisted).context("Failed to serialize state")?;
-    fs::write(state_file()?, json).context("Failed to write state file")?;
+
+    let mut last = LAST_SAVED.lock().unwrap_or_else(|e| e.into_inner());
+    if last.as_deref() == Some(json.as_str()) {
+        return Ok(());
+    }
+    fs::write(state_file()?, &json).context("Failed to write state file")?;
+    *last = Some(json);
     Ok(())
 }
 